@@ -1,5 +1,5 @@
-import asyncio
 import codecs
+from functools import lru_cache
 from pathlib import Path
 from typing import get_args
 
@@ -7,16 +7,23 @@ import click
 from pydantic import ValidationError
 
 from guidellm.backend import BackendType
-from guidellm.benchmark import ProfileType
 from guidellm.benchmark.entrypoints import benchmark_with_scenario
 from guidellm.benchmark.scenario import GenerativeTextScenario, get_builtin_scenarios
 from guidellm.config import print_config
 from guidellm.preprocess.dataset import ShortPromptStrategy, process_dataset
-from guidellm.scheduler import StrategyType
 from guidellm.utils import cli as cli_tools
 
-STRATEGY_PROFILE_CHOICES = set(
-    list(get_args(ProfileType)) + list(get_args(StrategyType))
+BACKEND_TYPE_CHOICES = get_args(BackendType)
+# Sorted union of the ProfileType and StrategyType literals, kept static so
+# building the CLI doesn't depend on introspecting them; tests guard against drift
+STRATEGY_PROFILE_CHOICES = (
+    "async",
+    "concurrent",
+    "constant",
+    "poisson",
+    "sweep",
+    "synchronous",
+    "throughput",
 )
 
 
@@ -39,7 +46,7 @@ def cli():
             dir_okay=False,
             path_type=Path,  # type: ignore[type-var]
         ),
-        click.Choice(get_builtin_scenarios()),
+        cli_tools.FastChoice(get_builtin_scenarios()),
     ),
     default=None,
     help=(
@@ -55,12 +62,10 @@ def cli():
 )
 @click.option(
     "--backend-type",
-    type=click.Choice(list(get_args(BackendType))),
-    help=(
-        "The type of backend to use to run requests against. Defaults to 'openai_http'."
-        f" Supported types: {', '.join(get_args(BackendType))}"
-    ),
+    type=cli_tools.FastChoice(BACKEND_TYPE_CHOICES),
+    help="The type of backend to use to run requests against.",
     default=GenerativeTextScenario.get_default("backend_type"),
+    show_default=True,
 )
 @click.option(
     "--backend-args",
@@ -68,7 +73,7 @@ def cli():
     default=GenerativeTextScenario.get_default("backend_args"),
     help=(
         "A JSON string containing any arguments to pass to the backend as a "
-        "dict with **kwargs."
+        "dict with **kwargs, or @ followed by the path to a JSON file."
     ),
 )
 @click.option(
@@ -96,7 +101,7 @@ def cli():
     callback=cli_tools.parse_json,
     help=(
         "A JSON string containing any arguments to pass to the processor constructor "
-        "as a dict with **kwargs."
+        "as a dict with **kwargs, or @ followed by the path to a JSON file."
     ),
 )
 @click.option(
@@ -114,13 +119,13 @@ def cli():
     callback=cli_tools.parse_json,
     help=(
         "A JSON string containing any arguments to pass to the dataset creation "
-        "as a dict with **kwargs."
+        "as a dict with **kwargs, or @ followed by the path to a JSON file."
     ),
 )
 @click.option(
     "--data-sampler",
     default=GenerativeTextScenario.get_default("data_sampler"),
-    type=click.Choice(["random"]),
+    type=cli_tools.FastChoice(["random"]),
     help=(
         "The data sampler type to use. 'random' will add a random shuffle on the data. "
         "Defaults to None"
@@ -128,11 +133,8 @@ def cli():
 )
 @click.option(
     "--rate-type",
-    type=click.Choice(STRATEGY_PROFILE_CHOICES),
-    help=(
-        "The type of benchmark to run. "
-        f"Supported types {', '.join(STRATEGY_PROFILE_CHOICES)}. "
-    ),
+    type=cli_tools.FastChoice(STRATEGY_PROFILE_CHOICES),
+    help="The type of benchmark to run.",
 )
 @click.option(
     "--rate",
@@ -199,21 +201,44 @@ def cli():
     is_flag=True,
     help="Set this flag to disable console output",
 )
+@click.option(
+    "--prefetch-data/--no-prefetch-data",
+    default=False,
+    help=(
+        "Warm the OS page cache for a local data file or directory before "
+        "running, reading multiple files in parallel. Defaults to disabled."
+    ),
+)
 @click.option(
     "--output-path",
     type=click.Path(),
-    default=Path.cwd() / "benchmarks.json",
+    default=None,
     help=(
         "The path to save the output to. If it is a directory, "
         "it will save benchmarks.json under it. "
         "Otherwise, json, yaml, or csv files are supported for output types "
-        "which will be read from the extension for the file path."
+        "which will be read from the extension for the file path. "
+        "Defaults to benchmarks.json in the current working directory."
+    ),
+)
+@click.option(
+    "--json-writer",
+    type=cli_tools.FastChoice(["stdlib", "orjson"]),
+    default="stdlib",
+    callback=cli_tools.validate_json_writer,
+    show_default=True,
+    help=(
+        "The library to use when saving json output. orjson is faster for large "
+        "outputs, requires guidellm[perf], and writes NaN values as null."
     ),
 )
 @click.option(
     "--output-extras",
     callback=cli_tools.parse_json,
-    help="A JSON string of extra data to save with the output benchmarks",
+    help=(
+        "A JSON string of extra data to save with the output benchmarks, "
+        "or @ followed by the path to a JSON file."
+    ),
 )
 @click.option(
     "--output-sampling",
@@ -250,7 +275,9 @@ def benchmark(
     disable_progress,
     display_scheduler_stats,
     disable_console_outputs,
+    prefetch_data,
     output_path,
+    json_writer,
     output_extras,
     output_sampling,
     random_seed,
@@ -294,7 +321,13 @@ def benchmark(
             errs[0]["msg"], ctx=click_ctx, param_hint=param_name
         ) from e
 
-    asyncio.run(
+    if output_path is None:
+        output_path = Path.cwd() / "benchmarks.json"
+
+    if prefetch_data:
+        cli_tools.prefetch_data_files(_scenario.data)
+
+    cli_tools.run_async(
         benchmark_with_scenario(
             scenario=_scenario,
             show_progress=not disable_progress,
@@ -302,10 +335,19 @@ def benchmark(
             output_console=not disable_console_outputs,
             output_path=output_path,
             output_extras=output_extras,
+            json_writer=json_writer,
         )
     )
 
 
+_UNICODE_ESCAPE_DECODER = codecs.getdecoder("unicode_escape")
+
+
+@lru_cache(maxsize=32)
+def _unicode_escape_decode(value: str) -> str:
+    return _UNICODE_ESCAPE_DECODER(value)[0]  # type: ignore[arg-type]
+
+
 def decode_escaped_str(_ctx, _param, value):
     """
     Click auto adds characters. For example, when using --pad-char "\n",
@@ -315,7 +357,7 @@ def decode_escaped_str(_ctx, _param, value):
     if value is None:
         return None
     try:
-        return codecs.decode(value, "unicode_escape")
+        return _unicode_escape_decode(value)
     except Exception as e:
         raise click.BadParameter(f"Could not decode escape sequences: {e}") from e
 
@@ -350,7 +392,7 @@ def preprocess():
 )
 @click.argument(
     "output_path",
-    type=click.Path(file_okay=True, dir_okay=False, writable=True, resolve_path=True),
+    type=click.Path(file_okay=True, dir_okay=False, writable=True),
     required=True,
 )
 @click.option(
@@ -368,7 +410,7 @@ def preprocess():
     callback=cli_tools.parse_json,
     help=(
         "A JSON string containing any arguments to pass to the processor constructor "
-        "as a dict with **kwargs."
+        "as a dict with **kwargs, or @ followed by the path to a JSON file."
     ),
 )
 @click.option(
@@ -376,12 +418,12 @@ def preprocess():
     callback=cli_tools.parse_json,
     help=(
         "A JSON string containing any arguments to pass to the dataset creation "
-        "as a dict with **kwargs."
+        "as a dict with **kwargs, or @ followed by the path to a JSON file."
     ),
 )
 @click.option(
     "--short-prompt-strategy",
-    type=click.Choice([s.value for s in ShortPromptStrategy]),
+    type=cli_tools.FastChoice([s.value for s in ShortPromptStrategy]),
     default=ShortPromptStrategy.IGNORE.value,
     show_default=True,
     help="Strategy to handle prompts shorter than the target length. ",
@@ -433,6 +475,22 @@ def preprocess():
     show_default=True,
     help="Random seed for prompt token sampling and output tokens sampling.",
 )
+@click.option(
+    "--num-proc",
+    type=int,
+    default=None,
+    help=(
+        "The number of processes to use when truncating prompts to their target "
+        "token counts. If None provided (default), runs in the current process."
+    ),
+)
+@click.option(
+    "--batch-size",
+    type=int,
+    default=1000,
+    show_default=True,
+    help="The number of prompts to tokenize per batch when truncating prompts.",
+)
 def dataset(
     data,
     output_path,
@@ -447,10 +505,12 @@ def dataset(
     push_to_hub,
     hub_dataset_id,
     random_seed,
+    num_proc,
+    batch_size,
 ):
     process_dataset(
         data=data,
-        output_path=output_path,
+        output_path=Path(output_path).resolve(),
         processor=processor,
         prompt_tokens=prompt_tokens,
         output_tokens=output_tokens,
@@ -462,6 +522,8 @@ def dataset(
         push_to_hub=push_to_hub,
         hub_dataset_id=hub_dataset_id,
         random_seed=random_seed,
+        num_proc=num_proc,
+        batch_size=batch_size,
     )
 
 
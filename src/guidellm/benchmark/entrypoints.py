@@ -62,6 +62,7 @@ async def benchmark_generative_text(
     show_progress: bool = True,
     show_progress_scheduler_stats: bool = False,
     output_console: bool = True,
+    json_writer: Literal["stdlib", "orjson"] = "stdlib",
 ) -> tuple[GenerativeBenchmarksReport, Optional[Path]]:
     console = GenerativeBenchmarksConsole(enabled=show_progress)
     console.print_line("Creating backend...")
@@ -143,7 +144,7 @@ async def benchmark_generative_text(
 
     if output_path:
         console.print_line("\nSaving benchmarks report...")
-        saved_path = report.save_file(output_path)
+        saved_path = report.save_file(output_path, json_writer=json_writer)
         console.print_line(f"Benchmarks report saved to {saved_path}")
     else:
         saved_path = None
@@ -28,6 +28,11 @@ from guidellm.objects import (
 from guidellm.scheduler import strategy_display_str
 from guidellm.utils import Colors, split_text_list_by_length
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 __all__ = [
     "GenerativeBenchmarksConsole",
     "GenerativeBenchmarksReport",
@@ -94,19 +99,24 @@ class GenerativeBenchmarksReport(StandardBaseModel):
 
         return self
 
-    def save_file(self, path: Union[str, Path]) -> Path:
+    def save_file(
+        self,
+        path: Union[str, Path],
+        json_writer: Literal["stdlib", "orjson"] = "stdlib",
+    ) -> Path:
         """
         Save the report to a file. The file type is determined by the file extension.
         If the file is a directory, it will save the report to a file named
         benchmarks.json under the directory.
 
         :param path: The path to save the report to.
+        :param json_writer: The library used to serialize JSON reports.
         :return: The path to the saved report.
         """
         path, type_ = GenerativeBenchmarksReport._file_setup(path)
 
         if type_ == "json":
-            return self.save_json(path)
+            return self.save_json(path, json_writer=json_writer)
 
         if type_ == "yaml":
             return self.save_yaml(path)
@@ -116,13 +126,19 @@ class GenerativeBenchmarksReport(StandardBaseModel):
 
         raise ValueError(f"Unsupported file type: {type_} for {path}.")
 
-    def save_json(self, path: Union[str, Path]) -> Path:
+    def save_json(
+        self,
+        path: Union[str, Path],
+        json_writer: Literal["stdlib", "orjson"] = "stdlib",
+    ) -> Path:
         """
         Save the report to a JSON file containing all of the report data which is
         reloadable using the pydantic model. If the file is a directory, it will save
         the report to a file named benchmarks.json under the directory.
 
         :param path: The path to save the report to.
+        :param json_writer: The library used to serialize the report. 'orjson' is
+            faster for large reports but writes NaN and infinite floats as null.
         :return: The path to the saved report.
         """
         path, type_ = GenerativeBenchmarksReport._file_setup(path, "json")
@@ -132,11 +148,27 @@ class GenerativeBenchmarksReport(StandardBaseModel):
                 f"Unsupported file type for saving a JSON: {type_} for {path}."
             )
 
+        if json_writer not in ("stdlib", "orjson"):
+            raise ValueError(f"Unsupported JSON writer: {json_writer}.")
+
+        if json_writer == "orjson" and orjson is None:
+            raise ValueError(
+                "The orjson JSON writer requires orjson to be installed, "
+                "for example with `pip install guidellm[perf]`."
+            )
+
         model_dict = self.model_dump()
-        model_json = json.dumps(model_dict)
 
-        with path.open("w") as file:
-            file.write(model_json)
+        if json_writer == "orjson":
+            path.write_bytes(
+                orjson.dumps(
+                    model_dict,
+                    option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+                )
+            )
+        else:
+            with path.open("w") as file:
+                file.write(json.dumps(model_dict))
 
         return path
 
@@ -36,10 +36,8 @@ def parse_float_list(value: Union[str, float, list[float]]) -> list[float]:
     elif isinstance(value, list):
         return value
 
-    values = value.split(",") if "," in value else [value]
-
     try:
-        return [float(val) for val in values]
+        return [float(val) for val in value.split(",")]
     except ValueError as err:
         raise ValueError(
             "must be a number or comma-separated list of numbers."
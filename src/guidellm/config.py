@@ -1,4 +1,5 @@
 import json
+import os
 from collections.abc import Sequence
 from enum import Enum
 from typing import Literal, Optional
@@ -123,6 +124,7 @@ class Settings(BaseSettings):
     max_concurrency: int = 512
     max_worker_processes: int = 10
     max_add_requests_per_loop: int = 20
+    max_worker_threads: int = min(64, (os.cpu_count() or 1) * 4)
 
     # Data settings
     dataset: DatasetSettings = DatasetSettings()
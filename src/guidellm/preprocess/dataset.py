@@ -222,6 +222,41 @@ class TokensConfig(BaseModel):
         return TokensConfig(**config_dict)
 
 
+def truncate_prompts_batch(
+    batch: dict[str, list[Any]],
+    tokenizer: PreTrainedTokenizerBase,
+    prompt_column: str,
+) -> dict[str, list[Any]]:
+    """
+    Truncates a batch of prompts to their sampled prompt token counts.
+    Intended for use with Dataset.map(batched=True) so the prompts are
+    tokenized with a single batched tokenizer call.
+
+    :param batch: Batch of dataset rows keyed by column name.
+    :param tokenizer: Tokenizer used to encode and decode the prompts.
+    :param prompt_column: Column key for prompt extraction.
+    :return: The prompt column truncated to the prompt_tokens_count of each row.
+    """
+
+    prompts = list(batch[prompt_column])
+    targets = batch["prompt_tokens_count"]
+    token_ids = tokenizer(prompts)["input_ids"]
+    too_long = [
+        index
+        for index, (tokens, target) in enumerate(zip(token_ids, targets))
+        if len(tokens) > target
+    ]
+
+    if too_long:
+        decoded = tokenizer.batch_decode(
+            [token_ids[index][: targets[index]] for index in too_long]
+        )
+        for index, prompt in zip(too_long, decoded):
+            prompts[index] = prompt
+
+    return {prompt_column: prompts}
+
+
 def _validate_output_suffix(output_path: Union[str, Path]) -> None:
     output_path = Path(output_path)
     suffix = output_path.suffix.lower()
@@ -246,6 +281,8 @@ def process_dataset(
     push_to_hub: bool = False,
     hub_dataset_id: Optional[str] = None,
     random_seed: int = 42,
+    num_proc: Optional[int] = None,
+    batch_size: int = 1000,
 ) -> None:
     """
     Main method to process and save a dataset with sampled prompt/output token counts.
@@ -263,6 +300,9 @@ def process_dataset(
     :param push_to_hub: Whether to push to Hugging Face Hub.
     :param hub_dataset_id: Dataset ID on Hugging Face Hub.
     :param random_seed: Seed for random sampling.
+    :param num_proc: Number of processes used to truncate prompts to their
+        target token counts. Defaults to None, which runs in this process.
+    :param batch_size: Number of prompts tokenized per batch when truncating.
     :raises ValueError: If output path is invalid or pushing conditions unmet.
     """
 
@@ -327,10 +367,6 @@ def process_dataset(
         if prompt_text is None:
             continue
 
-        tokens = tokenizer.encode(prompt_text)
-        if len(tokens) > target_prompt_len:
-            prompt_text = tokenizer.decode(tokens[:target_prompt_len])
-
         processed_prompt = prompt_row.copy()
         processed_prompt[prompt_column] = prompt_text
         processed_prompt["prompt_tokens_count"] = target_prompt_len
@@ -344,7 +380,13 @@ def process_dataset(
 
     logger.info(f"Generated processed dataset with {len(processed_prompts)} prompts")
 
-    processed_dataset = Dataset.from_list(processed_prompts)
+    processed_dataset = Dataset.from_list(processed_prompts).map(
+        truncate_prompts_batch,
+        fn_kwargs={"tokenizer": tokenizer, "prompt_column": prompt_column},
+        batched=True,
+        batch_size=batch_size,
+        num_proc=num_proc,
+    )
     save_dataset_to_file(processed_dataset, output_path)
     logger.info(f"Conversion completed. Dataset saved to: {output_path}")
 
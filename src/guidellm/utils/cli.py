@@ -1,18 +1,162 @@
+import asyncio
 import json
-from typing import Any
+import os
+import sys
+from collections.abc import Coroutine
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, TypeVar
 
 import click
+from loguru import logger
+
+from guidellm.config import settings
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None  # type: ignore[assignment]
+
+T = TypeVar("T")
+
+PREFETCH_CHUNK_SIZE = 1024 * 1024
 
 
 def parse_json(ctx, param, value):  # noqa: ARG001
+    """
+    Click callback that parses a JSON string option value.
+    A value of the form @path is read from the JSON file at that path instead,
+    and an empty value is treated as an empty dict.
+    Uses orjson when it is installed and falls back to the stdlib json module.
+    """
     if value is None:
         return None
+    # skip the parser for the common empty values
+    if value in ("", "{}"):
+        return {}
+    if value == "[]":
+        return []
+    if value.startswith("@"):
+        path = Path(value[1:])
+        try:
+            value = path.read_bytes()
+        except OSError as err:
+            raise click.BadParameter(
+                f"{param.name} could not read JSON file {path}: {err}"
+            ) from err
     try:
+        if orjson is not None:
+            return orjson.loads(value)
         return json.loads(value)
-    except json.JSONDecodeError as err:
+    except ValueError as err:  # JSON decode errors and invalid UTF-8 in files
         raise click.BadParameter(f"{param.name} must be a valid JSON string.") from err
 
 
+def validate_json_writer(ctx, param, value):  # noqa: ARG001
+    """
+    Click callback that rejects the orjson JSON writer when orjson is not
+    installed, so the error surfaces before a benchmark runs rather than when
+    its report is saved.
+    """
+    if value == "orjson" and orjson is None:
+        raise click.BadParameter(
+            "orjson is not installed, install it with `pip install guidellm[perf]` "
+            "or use the stdlib writer."
+        )
+    return value
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion on a new event loop, as asyncio.run does.
+    Uses a uvloop event loop when uvloop is installed, and replaces the loop's
+    default executor with a thread pool sized by settings.max_worker_threads.
+    """
+
+    async def _run() -> T:
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(
+                max_workers=settings.max_worker_threads,
+                thread_name_prefix="guidellm",
+            )
+        )
+        return await coro
+
+    if uvloop is None:
+        return asyncio.run(_run())
+
+    if sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            return runner.run(_run())
+
+    uvloop.install()
+    return asyncio.run(_run())
+
+
+def prefetch_data_files(data: Any) -> int:
+    """
+    Warm the OS page cache for a local data file, or for every non-hidden file
+    under a local data directory, so later reads by the dataset loaders hit
+    memory.
+    Files are prefetched in parallel threads using posix_fadvise where
+    available and falling back to reading them. Failures are only logged since
+    prefetching is an optimization.
+
+    :param data: The data argument, which may or may not be a local path.
+    :return: The number of files prefetched; 0 if data is not a local path.
+    """
+    if not isinstance(data, (str, Path)):
+        return 0
+
+    path = Path(data)
+    try:
+        if path.is_file():
+            files = [path]
+        elif path.is_dir():
+            files = [
+                file
+                for file in path.rglob("*")
+                if file.is_file()
+                and not any(
+                    part.startswith(".") for part in file.relative_to(path).parts
+                )
+            ]
+        else:
+            return 0
+    except OSError as err:
+        logger.debug(f"Failed to list data files to prefetch for {data}: {err}")
+        return 0
+
+    if not files:
+        return 0
+
+    with ThreadPoolExecutor(
+        max_workers=min(settings.max_worker_threads, len(files)),
+        thread_name_prefix="guidellm-prefetch",
+    ) as executor:
+        return sum(executor.map(_prefetch_file, files))
+
+
+def _prefetch_file(path: Path) -> bool:
+    try:
+        with path.open("rb") as file:
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(file.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+            else:
+                while file.read(PREFETCH_CHUNK_SIZE):
+                    pass
+    except OSError as err:
+        logger.debug(f"Failed to prefetch data file {path}: {err}")
+        return False
+
+    return True
+
+
 def set_if_not_default(ctx: click.Context, **kwargs) -> dict[str, Any]:
     """
     Set the value of a click option if it is not the default value.
@@ -61,3 +205,25 @@ class Union(click.ParamType):
 
         # Use square braces to indicate an option or optional argument.
         return f"[{choices_str}]"
+
+
+class FastChoice(click.Choice):
+    """
+    A click.Choice that checks exact matches against a frozenset of the
+    choices before falling back to click's normalizing linear search.
+    """
+
+    def __init__(self, choices, case_sensitive: bool = True):
+        super().__init__(choices, case_sensitive=case_sensitive)
+        self._choices_set = frozenset(self.choices)
+
+    def convert(self, value, param, ctx):
+        if (
+            self.case_sensitive
+            and (ctx is None or ctx.token_normalize_func is None)
+            and isinstance(value, str)
+            and value in self._choices_set
+        ):
+            return value
+
+        return super().convert(value, param, ctx)
@@ -61,6 +61,40 @@ def test_file_json():
     mock_path.unlink()
 
 
+def test_file_json_orjson():
+    pytest.importorskip("orjson")
+    mock_benchmark = mock_generative_benchmark()
+    report = GenerativeBenchmarksReport(benchmarks=[mock_benchmark])
+
+    mock_path = Path("mock_report_orjson.json")
+    report.save_file(mock_path, json_writer="orjson")
+
+    with mock_path.open("r") as file:
+        saved_data = json.load(file)
+    assert saved_data == report.model_dump()
+
+    loaded_report = GenerativeBenchmarksReport.load_file(mock_path)
+    loaded_benchmark = loaded_report.benchmarks[0]
+
+    for field in mock_benchmark.model_fields:
+        assert getattr(mock_benchmark, field) == getattr(loaded_benchmark, field)
+
+    mock_path.unlink()
+
+
+def test_file_json_invalid_writer():
+    report = GenerativeBenchmarksReport()
+
+    with pytest.raises(ValueError, match="Unsupported JSON writer"):
+        report.save_json(Path("mock_report.json"), json_writer="invalid")  # type: ignore[arg-type]
+
+    with (
+        patch("guidellm.benchmark.output.orjson", None),
+        pytest.raises(ValueError, match="requires orjson"),
+    ):
+        report.save_json(Path("mock_report.json"), json_writer="orjson")
+
+
 def test_file_yaml():
     mock_benchmark = mock_generative_benchmark()
     report = GenerativeBenchmarksReport(benchmarks=[mock_benchmark])
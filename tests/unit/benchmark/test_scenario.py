@@ -0,0 +1,26 @@
+import pytest
+
+from guidellm.benchmark.scenario import parse_float_list
+
+
+@pytest.mark.smoke
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (1, [1]),
+        (2.5, [2.5]),
+        ([1.0, 2.0], [1.0, 2.0]),
+        ("3", [3.0]),
+        ("1,2.5,10", [1.0, 2.5, 10.0]),
+        (" 1, 2 ", [1.0, 2.0]),
+    ],
+)
+def test_parse_float_list(value, expected):
+    assert parse_float_list(value) == expected
+
+
+@pytest.mark.sanity
+@pytest.mark.parametrize("value", ["", "a", "1,,2", "1,b"])
+def test_parse_float_list_invalid(value):
+    with pytest.raises(ValueError, match="comma-separated list of numbers"):
+        parse_float_list(value)
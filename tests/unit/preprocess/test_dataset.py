@@ -19,6 +19,7 @@ from guidellm.preprocess.dataset import (
     handle_pad_strategy,
     process_dataset,
     push_dataset_to_hub,
+    truncate_prompts_batch,
 )
 
 
@@ -29,6 +30,12 @@ def tokenizer_mock():
     tokenizer.decode.side_effect = lambda x, *args, **kwargs: "".join(
         str(item) for item in x
     )
+    tokenizer.side_effect = lambda texts, *args, **kwargs: {
+        "input_ids": [tokenizer.encode(text) for text in texts]
+    }
+    tokenizer.batch_decode.side_effect = lambda batch, *args, **kwargs: [
+        tokenizer.decode(item) for item in batch
+    ]
     return tokenizer
 
 
@@ -53,6 +60,7 @@ def test_strategy_handler_called(
 
         mock_dataset_obj = MagicMock(spec=Dataset)
         mock_dataset_class.from_list.return_value = mock_dataset_obj
+        mock_dataset_obj.map.return_value = mock_dataset_obj
 
         process_dataset(
             data="input",
@@ -142,6 +150,7 @@ def test_process_dataset_non_empty(
 
     mock_dataset_obj = MagicMock(spec=Dataset)
     mock_dataset_class.from_list.return_value = mock_dataset_obj
+    mock_dataset_obj.map.return_value = mock_dataset_obj
 
     output_path = "output_dir/data.json"
     process_dataset(
@@ -164,7 +173,40 @@ def test_process_dataset_non_empty(
         assert "prompt" in item
         assert "prompt_tokens_count" in item
         assert "output_tokens_count" in item
-        assert len(tokenizer_mock.encode(item["prompt"])) <= 3
+
+    mock_dataset_obj.map.assert_called_once_with(
+        truncate_prompts_batch,
+        fn_kwargs={"tokenizer": tokenizer_mock, "prompt_column": "prompt"},
+        batched=True,
+        batch_size=1000,
+        num_proc=None,
+    )
+
+
+@pytest.mark.smoke
+def test_truncate_prompts_batch(tokenizer_mock):
+    dataset = Dataset.from_list(
+        [
+            {"prompt": "Hello", "prompt_tokens_count": 3, "output_tokens_count": 1},
+            {"prompt": "Hi", "prompt_tokens_count": 3, "output_tokens_count": 2},
+            {
+                "prompt": "How are you?",
+                "prompt_tokens_count": 4,
+                "output_tokens_count": 3,
+            },
+        ]
+    )
+
+    truncated = dataset.map(
+        truncate_prompts_batch,
+        fn_kwargs={"tokenizer": tokenizer_mock, "prompt_column": "prompt"},
+        batched=True,
+        batch_size=2,
+    )
+
+    assert truncated["prompt"] == ["111", "Hi", "1111"]
+    assert truncated["prompt_tokens_count"] == [3, 3, 4]
+    assert truncated["output_tokens_count"] == [1, 2, 3]
 
 
 @pytest.mark.sanity
@@ -218,6 +260,7 @@ def test_process_dataset_push_to_hub_called(
 
     mock_dataset_obj = MagicMock(spec=Dataset)
     mock_dataset_class.from_list.return_value = mock_dataset_obj
+    mock_dataset_obj.map.return_value = mock_dataset_obj
 
     process_dataset(
         data="input",
@@ -252,6 +295,7 @@ def test_process_dataset_push_to_hub_not_called(
 
     mock_dataset_obj = MagicMock(spec=Dataset)
     mock_dataset_class.from_list.return_value = mock_dataset_obj
+    mock_dataset_obj.map.return_value = mock_dataset_obj
 
     process_dataset(
         data="input",
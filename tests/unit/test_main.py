@@ -0,0 +1,119 @@
+from pathlib import Path
+from typing import get_args
+from unittest.mock import AsyncMock, patch
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from guidellm.__main__ import STRATEGY_PROFILE_CHOICES, cli, decode_escaped_str
+from guidellm.benchmark import ProfileType
+from guidellm.scheduler import StrategyType
+
+
+@pytest.mark.smoke
+def test_strategy_profile_choices_match_types():
+    expected = tuple(sorted(set(get_args(ProfileType) + get_args(StrategyType))))
+    assert expected == STRATEGY_PROFILE_CHOICES
+
+
+@pytest.mark.smoke
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [(None, None), ("", ""), ("a", "a"), ("\\n", "\n"), ("\\t-\\u00e9", "\t-\u00e9")],
+)
+def test_decode_escaped_str(value, expected):
+    assert decode_escaped_str(None, None, value) == expected
+
+
+@pytest.mark.sanity
+def test_decode_escaped_str_invalid():
+    with pytest.raises(click.BadParameter, match="Could not decode escape"):
+        decode_escaped_str(None, None, "\\x")
+
+
+@pytest.fixture
+def mock_benchmark_with_scenario():
+    with patch(
+        "guidellm.__main__.benchmark_with_scenario",
+        new_callable=AsyncMock,
+    ) as mock:
+        yield mock
+
+
+@pytest.mark.sanity
+@pytest.mark.parametrize("output_args", [[], ["--output-path", "out.yaml"]])
+def test_benchmark_output_path(tmp_path, mock_benchmark_with_scenario, output_args):
+    runner = CliRunner()
+    with runner.isolated_filesystem(temp_dir=tmp_path) as cwd:
+        result = runner.invoke(
+            cli,
+            [
+                "benchmark",
+                "--target",
+                "http://localhost:8000",
+                "--data",
+                "prompt_tokens=16,output_tokens=16",
+                "--rate-type",
+                "synchronous",
+                *output_args,
+            ],
+        )
+
+    assert result.exit_code == 0, result.output
+    assert mock_benchmark_with_scenario.call_args.kwargs["json_writer"] == "stdlib"
+    output_path = mock_benchmark_with_scenario.call_args.kwargs["output_path"]
+    if output_args:
+        assert output_path == "out.yaml"
+    else:
+        assert output_path == Path(cwd) / "benchmarks.json"
+
+
+@pytest.mark.sanity
+def test_dataset_output_path_resolved(tmp_path):
+    runner = CliRunner()
+    with (
+        runner.isolated_filesystem(temp_dir=tmp_path) as cwd,
+        patch("guidellm.__main__.process_dataset") as mock_process,
+    ):
+        result = runner.invoke(
+            cli,
+            [
+                "preprocess",
+                "dataset",
+                "data.jsonl",
+                "out/converted.json",
+                "--processor",
+                "gpt2",
+            ],
+        )
+
+    assert result.exit_code == 0, result.output
+    kwargs = mock_process.call_args.kwargs
+    assert kwargs["output_path"] == Path(cwd).resolve() / "out" / "converted.json"
+    assert kwargs["num_proc"] is None
+    assert kwargs["batch_size"] == 1000
+
+
+@pytest.mark.sanity
+def test_benchmark_json_writer_orjson_missing(mock_benchmark_with_scenario):
+    with patch("guidellm.utils.cli.orjson", None):
+        result = CliRunner().invoke(
+            cli,
+            [
+                "benchmark",
+                "--target",
+                "http://localhost:8000",
+                "--data",
+                "prompt_tokens=16,output_tokens=16",
+                "--rate-type",
+                "synchronous",
+                "--json-writer",
+                "orjson",
+            ],
+        )
+
+    assert result.exit_code == 2
+    assert "--json-writer" in result.output
+    assert "orjson is not installed" in result.output
+    mock_benchmark_with_scenario.assert_not_called()
@@ -0,0 +1,171 @@
+import asyncio
+import threading
+from unittest.mock import MagicMock, patch
+
+import click
+import pytest
+
+from guidellm.utils import cli as cli_tools
+
+
+@pytest.fixture
+def json_param():
+    param = MagicMock()
+    param.name = "backend_args"
+    return param
+
+
+@pytest.mark.smoke
+def test_parse_json(json_param):
+    assert cli_tools.parse_json(None, json_param, None) is None
+    assert cli_tools.parse_json(None, json_param, '{"a": 1, "b": [1, 2]}') == {
+        "a": 1,
+        "b": [1, 2],
+    }
+    assert cli_tools.parse_json(None, json_param, "[1, 2]") == [1, 2]
+
+
+@pytest.mark.sanity
+@pytest.mark.parametrize(
+    ("value", "expected"), [("", {}), ("{}", {}), ("[]", []), (" {} ", {})]
+)
+def test_parse_json_empty(json_param, value, expected):
+    first = cli_tools.parse_json(None, json_param, value)
+    second = cli_tools.parse_json(None, json_param, value)
+    assert first == expected
+    assert first is not second
+
+
+@pytest.mark.sanity
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_parse_json_file(json_param, tmp_path, use_orjson):
+    path = tmp_path / "extras.json"
+    path.write_text('{"experiment": "a", "tags": ["x", "y"]}')
+    orjson = cli_tools.orjson if use_orjson else None
+    with patch.object(cli_tools, "orjson", orjson):
+        assert cli_tools.parse_json(None, json_param, f"@{path}") == {
+            "experiment": "a",
+            "tags": ["x", "y"],
+        }
+
+
+@pytest.mark.sanity
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_parse_json_file_invalid_encoding(json_param, tmp_path, use_orjson):
+    path = tmp_path / "extras.json"
+    path.write_bytes(b'{"a": "\xff"}')
+    orjson = cli_tools.orjson if use_orjson else None
+    with (
+        patch.object(cli_tools, "orjson", orjson),
+        pytest.raises(click.BadParameter, match="backend_args"),
+    ):
+        cli_tools.parse_json(None, json_param, f"@{path}")
+
+
+@pytest.mark.sanity
+def test_parse_json_file_missing(json_param, tmp_path):
+    with pytest.raises(click.BadParameter, match="could not read JSON file"):
+        cli_tools.parse_json(None, json_param, f"@{tmp_path / 'missing.json'}")
+
+
+@pytest.mark.sanity
+def test_parse_json_stdlib_fallback(json_param):
+    with patch.object(cli_tools, "orjson", None):
+        assert cli_tools.parse_json(None, json_param, '{"a": 1}') == {"a": 1}
+
+
+@pytest.mark.sanity
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_parse_json_invalid(json_param, use_orjson):
+    orjson = cli_tools.orjson if use_orjson else None
+    with (
+        patch.object(cli_tools, "orjson", orjson),
+        pytest.raises(click.BadParameter, match="backend_args"),
+    ):
+        cli_tools.parse_json(None, json_param, "{invalid")
+
+
+async def _current_loop_type() -> type:
+    return type(asyncio.get_running_loop())
+
+
+async def _executor_thread_name() -> str:
+    return await asyncio.get_running_loop().run_in_executor(
+        None, lambda: threading.current_thread().name
+    )
+
+
+@pytest.mark.smoke
+def test_run_async_without_uvloop():
+    with patch.object(cli_tools, "uvloop", None):
+        loop_type = cli_tools.run_async(_current_loop_type())
+
+    assert issubclass(loop_type, asyncio.AbstractEventLoop)
+
+
+@pytest.mark.sanity
+def test_run_async_with_uvloop():
+    uvloop = pytest.importorskip("uvloop")
+    with patch.object(cli_tools, "uvloop", uvloop):
+        loop_type = cli_tools.run_async(_current_loop_type())
+
+    assert loop_type is uvloop.Loop
+
+
+@pytest.mark.sanity
+def test_run_async_default_executor():
+    with patch.object(cli_tools, "uvloop", None):
+        thread_name = cli_tools.run_async(_executor_thread_name())
+
+    assert thread_name.startswith("guidellm")
+
+
+@pytest.mark.smoke
+def test_fast_choice():
+    choice = cli_tools.FastChoice(("a", "b"))
+    assert tuple(choice.choices) == ("a", "b")
+    assert choice.convert("a", None, None) == "a"
+
+    with pytest.raises(click.BadParameter):
+        choice.convert("c", None, None)
+
+
+@pytest.mark.sanity
+def test_fast_choice_case_insensitive():
+    choice = cli_tools.FastChoice(["sweep", "async"], case_sensitive=False)
+    assert choice.convert("SWEEP", None, None) == "sweep"
+    assert choice.convert("async", None, None) == "async"
+
+
+@pytest.mark.smoke
+def test_prefetch_data_files(tmp_path):
+    data_file = tmp_path / "data.jsonl"
+    data_file.write_text('{"prompt": "a"}\n')
+    (tmp_path / "shards").mkdir()
+    for index in range(3):
+        (tmp_path / "shards" / f"part-{index}.jsonl").write_text("{}\n")
+
+    assert cli_tools.prefetch_data_files(str(data_file)) == 1
+    for hidden in (".git", ".cache"):
+        (tmp_path / "shards" / hidden).mkdir()
+        (tmp_path / "shards" / hidden / "objects").write_text("ignored")
+    (tmp_path / "shards" / ".hidden.jsonl").write_text("{}\n")
+
+    assert cli_tools.prefetch_data_files(tmp_path / "shards") == 3
+    assert cli_tools.prefetch_data_files("prompt_tokens=16,output_tokens=16") == 0
+    assert cli_tools.prefetch_data_files(["a", "b"]) == 0
+
+
+@pytest.mark.sanity
+def test_prefetch_data_files_name_too_long():
+    data = "prompt_tokens=256,output_tokens=128," + "x" * 300
+    assert cli_tools.prefetch_data_files(data) == 0
+
+
+@pytest.mark.sanity
+def test_prefetch_data_files_read_fallback(tmp_path, monkeypatch):
+    data_file = tmp_path / "data.txt"
+    data_file.write_text("text\n" * 10)
+    monkeypatch.delattr(cli_tools.os, "posix_fadvise", raising=False)
+
+    assert cli_tools.prefetch_data_files(data_file) == 1